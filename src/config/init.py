@@ -1,19 +1,32 @@
 """Configuration module for SentinelSync"""
 
-from .settings import (
-    AppConfig,
-    PostgresConfig,
-    KafkaConfig,
-    CassandraConfig,
-    get_config,
-    reload_config,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .settings import (
+        AppConfig,
+        ConfigLoader,
+        PostgresConfig,
+        KafkaConfig,
+        CassandraConfig,
+        get_config,
+        reload_config,
+    )
 
 __all__ = [
     'AppConfig',
+    'ConfigLoader',
     'PostgresConfig',
     'KafkaConfig',
     'CassandraConfig',
     'get_config',
     'reload_config',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Import settings on first use so importing the package stays cheap
+    if name in __all__:
+        from . import settings
+        return getattr(settings, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -5,22 +5,122 @@ Loads and validates application configuration from YAML files and environment va
 Supports:
 - YAML configuration files
 - Environment variable overrides
-- Type-safe dataclasses
+- Type-safe, immutable dataclasses
 - Singleton pattern for global config access
 """
 
 import os
-import yaml
+import pickle
+import stat
+import sys
+import tempfile
+import threading
+from collections import ChainMap
+from operator import attrgetter
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any
+from types import MappingProxyType
+from dataclasses import dataclass, field
+from typing import BinaryIO, Iterator, List, Optional, Dict, Any
 import logging
 
 
 logger = logging.getLogger(__name__)
 
+# Parsed YAML is cached in a pickle sidecar next to the config file,
+# keyed by the file's mtime, size and inode. Opt-in with SENTINELSYNC_CONFIG_CACHE=1;
+# the sidecar is only unpickled if owned by the current user and not group/world-writable.
+_CACHE_SUFFIX = ".cache.pkl"
 
-@dataclass
+
+# librdkafka client config keys, shared by producer and consumer dicts
+_K_BOOTSTRAP = sys.intern('bootstrap.servers')
+_K_COMPRESSION = sys.intern('compression.type')
+_K_ACKS = sys.intern('acks')
+_K_RETRIES = sys.intern('retries')
+_K_RETRY_BACKOFF = sys.intern('retry.backoff.ms')
+_K_IDEMPOTENCE = sys.intern('enable.idempotence')
+_K_MAX_IN_FLIGHT = sys.intern('max.in.flight.requests.per.connection')
+_K_GROUP_ID = sys.intern('group.id')
+_K_OFFSET_RESET = sys.intern('auto.offset.reset')
+_K_AUTO_COMMIT = sys.intern('enable.auto.commit')
+_K_SESSION_TIMEOUT = sys.intern('session.timeout.ms')
+_K_MAX_POLL_INTERVAL = sys.intern('max.poll.interval.ms')
+_K_MAX_POLL_RECORDS = sys.intern('max.poll.records')
+
+
+def _intern_fields(config: Any, *names: str) -> None:
+    """Intern small-vocabulary string fields of a frozen config in place"""
+    for name in names:
+        value = getattr(config, name)
+        if type(value) is str:
+            object.__setattr__(config, name, sys.intern(value))
+
+
+def _iter_rule_errors(config: Any, rules: tuple) -> Iterator[str]:
+    """Yield the error message of every rule the config fails"""
+    return (fmt(config) for check, fmt in rules if not check(config))
+
+
+def _port_ok(port: int) -> bool:
+    """Check that a TCP port number is in range"""
+    return 1 <= port <= 65535
+
+
+_OFFSET_RESETS = ('earliest', 'latest', 'none')
+_VALID_OFFSET_RESETS = frozenset(_OFFSET_RESETS)
+_LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+
+# Validation rules: (check, error formatter) pairs, evaluated against the config object
+_POSTGRES_RULES = (
+    (lambda c: _port_ok(c.port), lambda c: f"Invalid PostgreSQL port: {c.port}"),
+    (lambda c: c.host, lambda c: "PostgreSQL host cannot be empty"),
+    (lambda c: c.database, lambda c: "PostgreSQL database cannot be empty"),
+    (lambda c: c.user, lambda c: "PostgreSQL user cannot be empty"),
+    (lambda c: c.replication_slot, lambda c: "PostgreSQL replication slot cannot be empty"),
+)
+
+_KAFKA_RULES = (
+    (lambda c: c.bootstrap_servers, lambda c: "Kafka bootstrap servers cannot be empty"),
+    (lambda c: c.topic, lambda c: "Kafka topic cannot be empty"),
+    (lambda c: c.group_id, lambda c: "Kafka group ID cannot be empty"),
+    (lambda c: c.auto_offset_reset in _VALID_OFFSET_RESETS,
+     lambda c: f"Invalid auto_offset_reset: {c.auto_offset_reset}. Must be one of {list(_OFFSET_RESETS)}"),
+)
+
+_CASSANDRA_RULES = (
+    (lambda c: c.hosts, lambda c: "Cassandra hosts cannot be empty"),
+    (lambda c: _port_ok(c.port), lambda c: f"Invalid Cassandra port: {c.port}"),
+    (lambda c: c.keyspace, lambda c: "Cassandra keyspace cannot be empty"),
+    (lambda c: c.replication_factor >= 1,
+     lambda c: f"Invalid replication factor: {c.replication_factor}. Must be >= 1"),
+)
+
+_APP_RULES = (
+    (lambda c: c.log_level in _VALID_LOG_LEVELS,
+     lambda c: f"Invalid log_level: {c.log_level}. Must be one of {list(_LOG_LEVELS)}"),
+    (lambda c: _port_ok(c.metrics_port), lambda c: f"Invalid metrics_port: {c.metrics_port}"),
+    (lambda c: _port_ok(c.health_check_port), lambda c: f"Invalid health_check_port: {c.health_check_port}"),
+    (lambda c: c.max_retries >= 0, lambda c: f"Invalid max_retries: {c.max_retries}. Must be >= 0"),
+    (lambda c: c.retry_backoff_seconds >= 0,
+     lambda c: f"Invalid retry_backoff_seconds: {c.retry_backoff_seconds}. Must be >= 0"),
+)
+
+# Every rule above flattened into (target getter, check, formatter) triples,
+# so AppConfig validates all components in a single pass
+_CONFIG_RULES = tuple(
+    (get, check, fmt)
+    for get, rules in (
+        (attrgetter('postgres'), _POSTGRES_RULES),
+        (attrgetter('kafka'), _KAFKA_RULES),
+        (attrgetter('cassandra'), _CASSANDRA_RULES),
+        (lambda c: c, _APP_RULES),
+    )
+    for check, fmt in rules
+)
+
+
+@dataclass(frozen=True, slots=True)
 class PostgresConfig:
     """PostgreSQL source database configuration"""
     host: str
@@ -31,45 +131,43 @@ class PostgresConfig:
     replication_slot: str
     publication: str = "sentinelsync_pub"
     
-    @property
-    def connection_string(self) -> str:
-        """Get PostgreSQL connection string"""
-        return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+    # Derived values, computed once in __post_init__
+    _connection_string: str = field(init=False, repr=False, compare=False)
+    _dsn: Dict[str, Any] = field(init=False, repr=False, compare=False)
     
-    @property
-    def dsn(self) -> Dict[str, Any]:
-        """Get DSN parameters for psycopg2"""
-        return {
+    def __post_init__(self):
+        object.__setattr__(
+            self, '_connection_string',
+            f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}",
+        )
+        object.__setattr__(self, '_dsn', {
             'host': self.host,
             'port': self.port,
             'database': self.database,
             'user': self.user,
             'password': self.password,
-        }
+        })
+    
+    @property
+    def connection_string(self) -> str:
+        """Get PostgreSQL connection string"""
+        return self._connection_string
+    
+    @property
+    def dsn(self) -> Dict[str, Any]:
+        """Get DSN parameters for psycopg2 (shared dict, copy before modifying)"""
+        return self._dsn
+    
+    def _iter_errors(self) -> Iterator[str]:
+        """Yield validation errors lazily"""
+        return _iter_rule_errors(self, _POSTGRES_RULES)
     
     def validate(self) -> List[str]:
         """Validate configuration and return list of errors"""
-        errors = []
-        
-        if self.port < 1 or self.port > 65535:
-            errors.append(f"Invalid PostgreSQL port: {self.port}")
-        
-        if not self.host:
-            errors.append("PostgreSQL host cannot be empty")
-        
-        if not self.database:
-            errors.append("PostgreSQL database cannot be empty")
-        
-        if not self.user:
-            errors.append("PostgreSQL user cannot be empty")
-        
-        if not self.replication_slot:
-            errors.append("PostgreSQL replication slot cannot be empty")
-        
-        return errors
+        return list(self._iter_errors())
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class KafkaConfig:
     """Apache Kafka configuration"""
     bootstrap_servers: str
@@ -81,53 +179,51 @@ class KafkaConfig:
     max_poll_interval_ms: int = 300000
     compression_type: str = "snappy"
     
+    # Derived values, computed once in __post_init__
+    _producer_config: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    _consumer_config: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        _intern_fields(self, 'group_id', 'auto_offset_reset', 'compression_type')
+        object.__setattr__(self, '_producer_config', {
+            _K_BOOTSTRAP: self.bootstrap_servers,
+            _K_COMPRESSION: self.compression_type,
+            _K_ACKS: 'all',  # Wait for all replicas
+            _K_RETRIES: 10,
+            _K_RETRY_BACKOFF: 100,
+            _K_IDEMPOTENCE: True,  # Exactly-once semantics
+            _K_MAX_IN_FLIGHT: 5,
+        })
+        object.__setattr__(self, '_consumer_config', {
+            _K_BOOTSTRAP: self.bootstrap_servers,
+            _K_GROUP_ID: self.group_id,
+            _K_OFFSET_RESET: self.auto_offset_reset,
+            _K_AUTO_COMMIT: self.enable_auto_commit,
+            _K_SESSION_TIMEOUT: self.session_timeout_ms,
+            _K_MAX_POLL_INTERVAL: self.max_poll_interval_ms,
+            _K_MAX_POLL_RECORDS: 500,  # Max records per poll
+        })
+    
     @property
-    def producer_config(self) -> dict:
-        """Get Kafka producer configuration"""
-        return {
-            'bootstrap.servers': self.bootstrap_servers,
-            'compression.type': self.compression_type,
-            'acks': 'all',  # Wait for all replicas
-            'retries': 10,
-            'retry.backoff.ms': 100,
-            'enable.idempotence': True,  # Exactly-once semantics
-            'max.in.flight.requests.per.connection': 5,
-        }
+    def producer_config(self) -> Dict[str, Any]:
+        """Get Kafka producer configuration (shared dict, copy before modifying)"""
+        return self._producer_config
     
     @property
-    def consumer_config(self) -> dict:
-        """Get Kafka consumer configuration"""
-        return {
-            'bootstrap.servers': self.bootstrap_servers,
-            'group.id': self.group_id,
-            'auto.offset.reset': self.auto_offset_reset,
-            'enable.auto.commit': self.enable_auto_commit,
-            'session.timeout.ms': self.session_timeout_ms,
-            'max.poll.interval.ms': self.max_poll_interval_ms,
-            'max.poll.records': 500,  # Max records per poll
-        }
+    def consumer_config(self) -> Dict[str, Any]:
+        """Get Kafka consumer configuration (shared dict, copy before modifying)"""
+        return self._consumer_config
+    
+    def _iter_errors(self) -> Iterator[str]:
+        """Yield validation errors lazily"""
+        return _iter_rule_errors(self, _KAFKA_RULES)
     
     def validate(self) -> List[str]:
         """Validate configuration and return list of errors"""
-        errors = []
-        
-        if not self.bootstrap_servers:
-            errors.append("Kafka bootstrap servers cannot be empty")
-        
-        if not self.topic:
-            errors.append("Kafka topic cannot be empty")
-        
-        if not self.group_id:
-            errors.append("Kafka group ID cannot be empty")
-        
-        valid_reset_values = ['earliest', 'latest', 'none']
-        if self.auto_offset_reset not in valid_reset_values:
-            errors.append(f"Invalid auto_offset_reset: {self.auto_offset_reset}. Must be one of {valid_reset_values}")
-        
-        return errors
+        return list(self._iter_errors())
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CassandraConfig:
     """Apache Cassandra sink database configuration"""
     hosts: List[str]
@@ -139,6 +235,14 @@ class CassandraConfig:
     protocol_version: int = 4
     consistency_level: str = "QUORUM"
     
+    # Derived values, computed once in __post_init__
+    _auth_provider: Optional[tuple] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        _intern_fields(self, 'keyspace', 'consistency_level')
+        auth = (self.username, self.password) if self.username and self.password else None
+        object.__setattr__(self, '_auth_provider', auth)
+    
     @property
     def contact_points(self) -> List[str]:
         """Get Cassandra contact points"""
@@ -147,30 +251,18 @@ class CassandraConfig:
     @property
     def auth_provider(self) -> Optional[tuple]:
         """Get authentication provider tuple (username, password) if configured"""
-        if self.username and self.password:
-            return (self.username, self.password)
-        return None
+        return self._auth_provider
+    
+    def _iter_errors(self) -> Iterator[str]:
+        """Yield validation errors lazily"""
+        return _iter_rule_errors(self, _CASSANDRA_RULES)
     
     def validate(self) -> List[str]:
         """Validate configuration and return list of errors"""
-        errors = []
-        
-        if not self.hosts:
-            errors.append("Cassandra hosts cannot be empty")
-        
-        if self.port < 1 or self.port > 65535:
-            errors.append(f"Invalid Cassandra port: {self.port}")
-        
-        if not self.keyspace:
-            errors.append("Cassandra keyspace cannot be empty")
-        
-        if self.replication_factor < 1:
-            errors.append(f"Invalid replication factor: {self.replication_factor}. Must be >= 1")
-        
-        return errors
+        return list(self._iter_errors())
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Application-wide configuration"""
     postgres: PostgresConfig
@@ -182,40 +274,53 @@ class AppConfig:
     max_retries: int = 5
     retry_backoff_seconds: int = 2
     
+    def __post_init__(self):
+        _intern_fields(self, 'log_level')
+    
+    def _iter_errors(self) -> Iterator[str]:
+        """Yield validation errors for each component, then app settings"""
+        for get, check, fmt in _CONFIG_RULES:
+            target = get(self)
+            if not check(target):
+                yield fmt(target)
+    
     def validate(self) -> List[str]:
         """Validate entire configuration and return list of errors"""
-        errors = []
-        
-        # Validate each component
-        errors.extend(self.postgres.validate())
-        errors.extend(self.kafka.validate())
-        errors.extend(self.cassandra.validate())
-        
-        # Validate app settings
-        valid_log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if self.log_level not in valid_log_levels:
-            errors.append(f"Invalid log_level: {self.log_level}. Must be one of {valid_log_levels}")
-        
-        if self.metrics_port < 1 or self.metrics_port > 65535:
-            errors.append(f"Invalid metrics_port: {self.metrics_port}")
-        
-        if self.health_check_port < 1 or self.health_check_port > 65535:
-            errors.append(f"Invalid health_check_port: {self.health_check_port}")
-        
-        if self.max_retries < 0:
-            errors.append(f"Invalid max_retries: {self.max_retries}. Must be >= 0")
-        
-        if self.retry_backoff_seconds < 0:
-            errors.append(f"Invalid retry_backoff_seconds: {self.retry_backoff_seconds}. Must be >= 0")
-        
-        return errors
+        return list(self._iter_errors())
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary (for serialization)"""
+        pg, kf, cs = self.postgres, self.kafka, self.cassandra
         return {
-            'postgres': asdict(self.postgres),
-            'kafka': asdict(self.kafka),
-            'cassandra': asdict(self.cassandra),
+            'postgres': {
+                'host': pg.host,
+                'port': pg.port,
+                'database': pg.database,
+                'user': pg.user,
+                'password': pg.password,
+                'replication_slot': pg.replication_slot,
+                'publication': pg.publication,
+            },
+            'kafka': {
+                'bootstrap_servers': kf.bootstrap_servers,
+                'topic': kf.topic,
+                'group_id': kf.group_id,
+                'auto_offset_reset': kf.auto_offset_reset,
+                'enable_auto_commit': kf.enable_auto_commit,
+                'session_timeout_ms': kf.session_timeout_ms,
+                'max_poll_interval_ms': kf.max_poll_interval_ms,
+                'compression_type': kf.compression_type,
+            },
+            'cassandra': {
+                'hosts': list(cs.hosts),
+                'port': cs.port,
+                'keyspace': cs.keyspace,
+                'replication_factor': cs.replication_factor,
+                'username': cs.username,
+                'password': cs.password,
+                'protocol_version': cs.protocol_version,
+                'consistency_level': cs.consistency_level,
+            },
             'log_level': self.log_level,
             'metrics_port': self.metrics_port,
             'health_check_port': self.health_check_port,
@@ -224,6 +329,73 @@ class AppConfig:
         }
 
 
+def _split_csv(value: str) -> List[str]:
+    """Split a comma-separated value into a list of stripped items"""
+    return [item.strip() for item in value.split(',')]
+
+
+# Environment variable overrides: (section, field, env var, cast, default)
+_ENV_SPEC = (
+    # PostgreSQL
+    ('postgres', 'host', 'POSTGRES_HOST', str, 'localhost'),
+    ('postgres', 'port', 'POSTGRES_PORT', int, 5432),
+    ('postgres', 'database', 'POSTGRES_DB', str, 'sourcedb'),
+    ('postgres', 'user', 'POSTGRES_USER', str, 'cdcuser'),
+    ('postgres', 'password', 'POSTGRES_PASSWORD', str, 'cdcpass'),
+    ('postgres', 'replication_slot', 'POSTGRES_REPLICATION_SLOT', str, 'sentinelsync_slot'),
+    ('postgres', 'publication', 'POSTGRES_PUBLICATION', str, 'sentinelsync_pub'),
+    # Kafka
+    ('kafka', 'bootstrap_servers', 'KAFKA_BOOTSTRAP_SERVERS', str, 'localhost:9092'),
+    ('kafka', 'topic', 'KAFKA_TOPIC', str, 'cdc.events'),
+    ('kafka', 'group_id', 'KAFKA_GROUP_ID', str, 'sentinelsync-consumer'),
+    ('kafka', 'auto_offset_reset', 'KAFKA_AUTO_OFFSET_RESET', str, 'earliest'),
+    ('kafka', 'session_timeout_ms', 'KAFKA_SESSION_TIMEOUT_MS', int, None),
+    ('kafka', 'max_poll_interval_ms', 'KAFKA_MAX_POLL_INTERVAL_MS', int, None),
+    # Cassandra
+    ('cassandra', 'hosts', 'CASSANDRA_HOSTS', _split_csv, None),
+    ('cassandra', 'port', 'CASSANDRA_PORT', int, 9042),
+    ('cassandra', 'keyspace', 'CASSANDRA_KEYSPACE', str, 'sinkdb'),
+    ('cassandra', 'replication_factor', 'CASSANDRA_REPLICATION_FACTOR', int, 3),
+    ('cassandra', 'username', 'CASSANDRA_USERNAME', str, None),
+    ('cassandra', 'password', 'CASSANDRA_PASSWORD', str, None),
+    # Application
+    ('app', 'log_level', 'LOG_LEVEL', str, 'INFO'),
+    ('app', 'metrics_port', 'METRICS_PORT', int, 9090),
+    ('app', 'health_check_port', 'HEALTH_CHECK_PORT', int, 8080),
+    ('app', 'max_retries', 'MAX_RETRIES', int, 5),
+    ('app', 'retry_backoff_seconds', 'RETRY_BACKOFF_SECONDS', int, 2),
+)
+
+
+def _group_env_spec(spec: tuple) -> tuple:
+    """Group an env spec into (section, ((field, env var, cast), ...), defaults) entries"""
+    overrides: Dict[str, list] = {}
+    defaults: Dict[str, Dict[str, Any]] = {}
+    for section, name, key, cast, default in spec:
+        overrides.setdefault(section, []).append((name, key, cast))
+        section_defaults = defaults.setdefault(section, {})
+        if default is not None:
+            section_defaults[name] = default
+    return tuple(
+        (section, tuple(items), MappingProxyType(defaults[section]))
+        for section, items in overrides.items()
+    )
+
+
+_ENV_SECTIONS = _group_env_spec(_ENV_SPEC)
+_ENV_VARS = tuple(key for _, _, key, _, _ in _ENV_SPEC)
+
+# Validated configs keyed by (path, stat signature, env override values), FIFO-bounded
+_PARSE_CACHE_SIZE = 16
+_parse_cache: Dict[tuple, AppConfig] = {}
+_parse_cache_lock = threading.Lock()
+
+
+def _stat_signature(st: os.stat_result) -> tuple:
+    """Identify a config file version; the inode catches files replaced by rename"""
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 class ConfigLoader:
     """Loads configuration from YAML file with environment variable overrides"""
     
@@ -247,6 +419,9 @@ class ConfigLoader:
         - CASSANDRA_HOSTS, CASSANDRA_KEYSPACE, etc.
         - LOG_LEVEL, METRICS_PORT, etc.
         
+        Results are cached in-process and reused while the file's mtime, size
+        and inode and the override environment variables are unchanged.
+        
         Args:
             env_overrides: Whether to apply environment variable overrides
             
@@ -257,12 +432,26 @@ class ConfigLoader:
             FileNotFoundError: If config file doesn't exist
             ValueError: If configuration validation fails
         """
-        # Load YAML config
-        config_data = self._load_yaml()
+        with self._open_config() as f:
+            st = os.fstat(f.fileno())
+            env: Optional[Dict[str, str]] = None
+            env_key: Optional[tuple] = None
+            if env_overrides:
+                env = os.environ.copy()
+                env_key = tuple(env.get(key) for key in _ENV_VARS)
+            cache_key = (os.path.abspath(f.name), _stat_signature(st), env_key)
+            
+            # Reuse an already validated config if nothing it depends on changed
+            config = _parse_cache.get(cache_key)
+            if config is not None:
+                return config
+            
+            # Load YAML config
+            config_data = self._load_yaml(f, st)
         
         # Apply environment variable overrides if requested
         if env_overrides:
-            config_data = self._apply_env_overrides(config_data)
+            config_data = self._apply_env_overrides(config_data, env)
         
         # Create config objects
         config = self._create_config(config_data)
@@ -273,97 +462,115 @@ class ConfigLoader:
             error_msg = "Configuration validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
             raise ValueError(error_msg)
         
+        with _parse_cache_lock:
+            if len(_parse_cache) >= _PARSE_CACHE_SIZE:
+                del _parse_cache[next(iter(_parse_cache))]  # Evict oldest
+            _parse_cache[cache_key] = config
+        
         return config
     
-    def _load_yaml(self) -> Dict[str, Any]:
-        """Load YAML configuration file"""
-        config_file = Path(self.config_path)
-        
-        # Check if file exists
-        if not config_file.exists():
-            # Try looking in parent directory
-            config_file = Path("config") / "app.yaml"
-            if not config_file.exists():
-                raise FileNotFoundError(
-                    f"Configuration file not found: {self.config_path}\n"
-                    "Please ensure config/app.yaml exists or set CONFIG_PATH environment variable."
-                )
-        
-        with open(config_file, 'r') as f:
-            try:
-                config_data = yaml.safe_load(f)
-                logger.info(f"Loaded configuration from {config_file}")
-                return config_data
-            except yaml.YAMLError as e:
-                raise ValueError(f"Failed to parse YAML configuration: {e}")
+    def _open_config(self) -> BinaryIO:
+        """Open the configuration file, falling back to config/app.yaml"""
+        try:
+            return open(self.config_path, 'rb')
+        except FileNotFoundError:
+            pass
+        
+        # Try looking in parent directory
+        try:
+            return open(Path("config") / "app.yaml", 'rb')
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Configuration file not found: {self.config_path}\n"
+                "Please ensure config/app.yaml exists or set CONFIG_PATH environment variable."
+            ) from None
     
-    def _apply_env_overrides(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply environment variable overrides to config data"""
+    def _load_yaml(self, f: BinaryIO, st: os.stat_result) -> Dict[str, Any]:
+        """Load YAML configuration from an open config file"""
+        config_file = Path(f.name)
+        stat_key = _stat_signature(st)
+        cache_file = config_file.with_name(config_file.name + _CACHE_SUFFIX)
+        use_cache = os.getenv('SENTINELSYNC_CONFIG_CACHE') == '1'
+        
+        if use_cache:
+            config_data = self._read_cache(cache_file, stat_key)
+            if config_data is not None:
+                logger.info(f"Loaded configuration from {config_file} (cached)")
+                return config_data
         
-        # PostgreSQL overrides
-        if 'postgres' in config_data:
-            pg = config_data['postgres']
-            pg['host'] = os.getenv('POSTGRES_HOST', pg.get('host', 'localhost'))
-            pg['port'] = int(os.getenv('POSTGRES_PORT', pg.get('port', 5432)))
-            pg['database'] = os.getenv('POSTGRES_DB', pg.get('database', 'sourcedb'))
-            pg['user'] = os.getenv('POSTGRES_USER', pg.get('user', 'cdcuser'))
-            pg['password'] = os.getenv('POSTGRES_PASSWORD', pg.get('password', 'cdcpass'))
-            pg['replication_slot'] = os.getenv('POSTGRES_REPLICATION_SLOT', 
-                                              pg.get('replication_slot', 'sentinelsync_slot'))
-            pg['publication'] = os.getenv('POSTGRES_PUBLICATION', 
-                                         pg.get('publication', 'sentinelsync_pub'))
+        raw = f.read()
         
-        # Kafka overrides
-        if 'kafka' in config_data:
-            kf = config_data['kafka']
-            kf['bootstrap_servers'] = os.getenv('KAFKA_BOOTSTRAP_SERVERS', 
-                                               kf.get('bootstrap_servers', 'localhost:9092'))
-            kf['topic'] = os.getenv('KAFKA_TOPIC', kf.get('topic', 'cdc.events'))
-            kf['group_id'] = os.getenv('KAFKA_GROUP_ID', kf.get('group_id', 'sentinelsync-consumer'))
-            kf['auto_offset_reset'] = os.getenv('KAFKA_AUTO_OFFSET_RESET', 
-                                               kf.get('auto_offset_reset', 'earliest'))
-            
-            # Optional numeric overrides
-            if os.getenv('KAFKA_SESSION_TIMEOUT_MS'):
-                kf['session_timeout_ms'] = int(os.getenv('KAFKA_SESSION_TIMEOUT_MS'))
-            if os.getenv('KAFKA_MAX_POLL_INTERVAL_MS'):
-                kf['max_poll_interval_ms'] = int(os.getenv('KAFKA_MAX_POLL_INTERVAL_MS'))
+        # Deferred so processes that never parse YAML skip importing PyYAML
+        import yaml
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)  # SafeLoader if built without libyaml
         
-        # Cassandra overrides
-        if 'cassandra' in config_data:
-            cs = config_data['cassandra']
-            
-            # Handle hosts (comma-separated list)
-            hosts_env = os.getenv('CASSANDRA_HOSTS')
-            if hosts_env:
-                cs['hosts'] = [h.strip() for h in hosts_env.split(',')]
-            
-            cs['port'] = int(os.getenv('CASSANDRA_PORT', cs.get('port', 9042)))
-            cs['keyspace'] = os.getenv('CASSANDRA_KEYSPACE', cs.get('keyspace', 'sinkdb'))
-            cs['replication_factor'] = int(os.getenv('CASSANDRA_REPLICATION_FACTOR', 
-                                                     cs.get('replication_factor', 3)))
-            cs['username'] = os.getenv('CASSANDRA_USERNAME', cs.get('username'))
-            cs['password'] = os.getenv('CASSANDRA_PASSWORD', cs.get('password'))
+        try:
+            config_data = yaml.load(raw, Loader=loader)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Failed to parse YAML configuration: {e}")
         
-        # App settings overrides
-        if 'app' in config_data:
-            app = config_data['app']
-            app['log_level'] = os.getenv('LOG_LEVEL', app.get('log_level', 'INFO'))
-            app['metrics_port'] = int(os.getenv('METRICS_PORT', app.get('metrics_port', 9090)))
-            app['health_check_port'] = int(os.getenv('HEALTH_CHECK_PORT', 
-                                                     app.get('health_check_port', 8080)))
-            app['max_retries'] = int(os.getenv('MAX_RETRIES', app.get('max_retries', 5)))
-            app['retry_backoff_seconds'] = int(os.getenv('RETRY_BACKOFF_SECONDS', 
-                                                         app.get('retry_backoff_seconds', 2)))
-        else:
-            # Create app section if it doesn't exist
-            config_data['app'] = {
-                'log_level': os.getenv('LOG_LEVEL', 'INFO'),
-                'metrics_port': int(os.getenv('METRICS_PORT', 9090)),
-                'health_check_port': int(os.getenv('HEALTH_CHECK_PORT', 8080)),
-                'max_retries': int(os.getenv('MAX_RETRIES', 5)),
-                'retry_backoff_seconds': int(os.getenv('RETRY_BACKOFF_SECONDS', 2)),
+        logger.info(f"Loaded configuration from {config_file}")
+        if use_cache:
+            self._write_cache(cache_file, stat_key, config_data)
+        return config_data
+    
+    @staticmethod
+    def _read_cache(cache_file: Path, stat_key: tuple) -> Optional[Dict[str, Any]]:
+        """Return cached config data if the sidecar matches the config file's stat"""
+        try:
+            with open(cache_file, 'rb') as f:
+                # Unpickling runs code, so refuse sidecars anyone else could have written
+                st = os.fstat(f.fileno())
+                getuid = getattr(os, 'getuid', None)  # Not available on Windows
+                if (getuid is not None and st.st_uid != getuid()) or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+                    logger.debug(f"Ignoring config cache {cache_file}: not owned by this user or writable by others")
+                    return None
+                cached_key, config_data = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable config cache {cache_file}: {e}")
+            return None
+        
+        if cached_key != stat_key:
+            return None
+        return config_data
+    
+    @staticmethod
+    def _write_cache(cache_file: Path, stat_key: tuple, config_data: Dict[str, Any]) -> None:
+        """Atomically write parsed config data to the sidecar cache (best effort)"""
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, prefix=cache_file.name, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((stat_key, config_data), f, protocol=5)
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write config cache {cache_file}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    
+    def _apply_env_overrides(self, config_data: Dict[str, Any],
+                             env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Apply environment variable overrides to config data"""
+        if env is None:
+            env = os.environ.copy()
+        
+        # Precedence: environment, then YAML, then built-in defaults
+        for section, overrides, defaults in _ENV_SECTIONS:
+            # Empty values only override string fields
+            env_values = {
+                name: raw for name, key, cast in overrides
+                if (raw := env.get(key)) is not None and (raw or cast is str)
             }
+            values = dict(ChainMap(env_values, config_data.get(section) or {}, defaults))
+            
+            # Env values and quoted YAML scalars arrive as str; cast non-str fields
+            for name, _, cast in overrides:
+                value = values.get(name)
+                if cast is not str and isinstance(value, str):
+                    values[name] = cast(value)
+            config_data[section] = values
         
         return config_data
     
@@ -422,15 +629,19 @@ class ConfigLoader:
         )
 
 
-# Singleton configuration instance
-_config: Optional[AppConfig] = None
-_loader: Optional[ConfigLoader] = None
+# Singleton configuration instances, keyed by config path
+_configs: Dict[str, AppConfig] = {}
+_DEFAULT_CONFIG_PATH = "config/app.yaml"
+_config_path = _DEFAULT_CONFIG_PATH  # Last path requested, reused when none is given
+_config_lock = threading.Lock()
 
 
 def get_config(config_path: Optional[str] = None, reload: bool = False) -> AppConfig:
     """
     Get the global configuration instance (lazy-loaded singleton).
     
+    Thread-safe: concurrent first calls load the configuration only once.
+    
     Args:
         config_path: Optional path to configuration file
         reload: Force reload configuration
@@ -438,14 +649,26 @@ def get_config(config_path: Optional[str] = None, reload: bool = False) -> AppCo
     Returns:
         AppConfig instance
     """
-    global _config, _loader
+    global _config_path
+    
+    path = config_path or _config_path
+    config = _configs.get(path)
     
-    if reload or _config is None:
-        if _loader is None or config_path:
-            _loader = ConfigLoader(config_path or "config/app.yaml")
-        _config = _loader.load()
+    if config is None or reload:
+        with _config_lock:
+            config = None if reload else _configs.get(path)
+            if config is None:
+                if reload:
+                    with _parse_cache_lock:
+                        _parse_cache.clear()
+                config = ConfigLoader(path).load()
+                if reload:
+                    _configs.clear()
+                _configs[path] = config
     
-    return _config
+    if config_path:
+        _config_path = config_path
+    return config
 
 
 def reload_config(config_path: Optional[str] = None) -> AppConfig:
@@ -461,31 +684,42 @@ def reload_config(config_path: Optional[str] = None) -> AppConfig:
     return get_config(config_path, reload=True)
 
 
+def _reset_for_tests():
+    """Drop the singleton configs and parse cache, restoring the default path"""
+    global _config_path
+    
+    with _config_lock:
+        _configs.clear()
+        _config_path = _DEFAULT_CONFIG_PATH
+        with _parse_cache_lock:
+            _parse_cache.clear()
+
+
 def print_config_summary(config: AppConfig):
     """Print a summary of the configuration (for debugging)"""
-    print("\n" + "="*60)
-    print("📋 SentinelSync Configuration Summary")
-    print("="*60)
-    
-    print("\n🔵 PostgreSQL:")
-    print(f"  Host: {config.postgres.host}:{config.postgres.port}")
-    print(f"  Database: {config.postgres.database}")
-    print(f"  User: {config.postgres.user}")
-    print(f"  Replication Slot: {config.postgres.replication_slot}")
-    
-    print("\n🟡 Kafka:")
-    print(f"  Bootstrap Servers: {config.kafka.bootstrap_servers}")
-    print(f"  Topic: {config.kafka.topic}")
-    print(f"  Consumer Group: {config.kafka.group_id}")
-    
-    print("\n🟢 Cassandra:")
-    print(f"  Hosts: {', '.join(config.cassandra.hosts)}")
-    print(f"  Keyspace: {config.cassandra.keyspace}")
-    print(f"  Replication Factor: {config.cassandra.replication_factor}")
-    
-    print("\n⚙️ Application:")
-    print(f"  Log Level: {config.log_level}")
-    print(f"  Metrics Port: {config.metrics_port}")
-    print(f"  Health Check Port: {config.health_check_port}")
-    print(f"  Max Retries: {config.max_retries}")
-    print("="*60 + "\n")
\ No newline at end of file
+    rule = "=" * 60
+    hosts = ', '.join(config.cassandra.hosts)
+    sys.stdout.write(
+        f"\n{rule}\n"
+        "📋 SentinelSync Configuration Summary\n"
+        f"{rule}\n"
+        "\n🔵 PostgreSQL:\n"
+        f"  Host: {config.postgres.host}:{config.postgres.port}\n"
+        f"  Database: {config.postgres.database}\n"
+        f"  User: {config.postgres.user}\n"
+        f"  Replication Slot: {config.postgres.replication_slot}\n"
+        "\n🟡 Kafka:\n"
+        f"  Bootstrap Servers: {config.kafka.bootstrap_servers}\n"
+        f"  Topic: {config.kafka.topic}\n"
+        f"  Consumer Group: {config.kafka.group_id}\n"
+        "\n🟢 Cassandra:\n"
+        f"  Hosts: {hosts}\n"
+        f"  Keyspace: {config.cassandra.keyspace}\n"
+        f"  Replication Factor: {config.cassandra.replication_factor}\n"
+        "\n⚙️ Application:\n"
+        f"  Log Level: {config.log_level}\n"
+        f"  Metrics Port: {config.metrics_port}\n"
+        f"  Health Check Port: {config.health_check_port}\n"
+        f"  Max Retries: {config.max_retries}\n"
+        f"{rule}\n\n"
+    )
\ No newline at end of file
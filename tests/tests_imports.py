@@ -2,21 +2,13 @@
 Test that all required modules can be imported.
 """
 
-import pytest
+import importlib.util
 
 
 def test_imports():
-    """Test that core dependencies can be imported"""
-    try:
-        import yaml
-        import psycopg2
-        import confluent_kafka
-        import cassandra
-    except ImportError as e:
-        pytest.fail(f"Failed to import dependency: {e}")
-    
-    # If we get here, all imports succeeded
-    assert True
+    """Test that core dependencies are installed (without executing them)"""
+    for name in ('yaml', 'psycopg2', 'confluent_kafka', 'cassandra'):
+        assert importlib.util.find_spec(name) is not None, f"Missing dependency: {name}"
 
 
 def test_version():